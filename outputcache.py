@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# Output fingerprints for skipping unchanged exports
+
+import os
+import sys
+import json
+import hashlib
+import reader
+import exporter
+import versions
+
+FINGERPRINT_SUFFIX       = ".fingerprint"
+RAW_FILES                = (reader.LANGUAGE_FILE, reader.MLISTS_FILE, reader.MNAMES_FILE, reader.DATA_MAIN_FILE)
+CHUNK_SIZE               = 1 << 20
+
+def _hashFile(digest, filename):
+    '''Feed contents of filename to digest'''
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+def getDatasetFingerprint(version):
+    '''Return content hash of a raw folder or release zip file, or None if the dataset is not available'''
+    digest = hashlib.sha256()
+    try:
+        if version == "raw":
+            for name in RAW_FILES:
+                digest.update(name.encode("utf-8") + b"\0")
+                _hashFile(digest, os.path.join(version, name))
+        else:
+            digest.update(version["zipfile"].encode("utf-8") + b"\0")
+            _hashFile(digest, version["zipfile"])
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def getCodeFingerprint():
+    '''Return content hash of the tool's own modules, or None if they cannot be read'''
+    digest = hashlib.sha256()
+    main_file = getattr(sys.modules["__main__"], "__file__", None)
+    if main_file == None:
+        return None
+    try:
+        for filename in (main_file, reader.__file__, exporter.__file__, versions.__file__, __file__):
+            digest.update(os.path.basename(filename).encode("utf-8") + b"\0")
+            _hashFile(digest, filename)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def getOptions(args):
+    '''Return the options that affect export output in normalized form'''
+    return {"exclude_taxa": sorted(set(t for t in args.exclude_taxa.split(",") if t != "")),
+            "meaning_list": args.meaning_list,
+            "format": args.format,
+            "correlate": args.correlate,
+            "no_singletons": args.no_singletons,
+            "no_invariables": args.no_invariables,
+            "charset_labels": args.charset_labels,
+            "charsets": args.charsets,
+            "dialect": args.dialect}
+
+def getFingerprint(version, args, tool_version):
+    '''Return fingerprint of dataset, options, tool version and tool code, or None if the dataset or the code cannot be read'''
+    dataset_fingerprint = getDatasetFingerprint(version)
+    code_fingerprint = getCodeFingerprint()
+    if dataset_fingerprint == None or code_fingerprint == None:
+        return None
+    key = json.dumps({"dataset": dataset_fingerprint,
+                      "options": getOptions(args),
+                      "tool": tool_version,
+                      "code": code_fingerprint}, sort_keys=True)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+def isUpToDate(outfile, fingerprint):
+    '''Return True if outfile exists and was written with fingerprint'''
+    if fingerprint == None or not os.path.isfile(outfile):
+        return False
+    try:
+        with open(outfile + FINGERPRINT_SUFFIX) as f:
+            return f.read().strip() == fingerprint
+    except OSError:
+        return False
+
+def clearFingerprint(outfile):
+    '''Remove the sidecar fingerprint of outfile, if any'''
+    try:
+        os.remove(outfile + FINGERPRINT_SUFFIX)
+    except OSError:
+        pass
+
+def writeFingerprint(outfile, fingerprint):
+    '''Store fingerprint in a sidecar file next to outfile, if outfile is a regular file'''
+    if fingerprint == None or not os.path.isfile(outfile):
+        return
+    with open(outfile + FINGERPRINT_SUFFIX, "w") as f:
+        f.write(fingerprint + "\n")
+
+if __name__ == '__main__':
+    print("Output cache functions for uralex_export")
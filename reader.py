@@ -5,7 +5,6 @@ import io
 import os
 import sys
 import zipfile
-import urllib.request
 import csv
 
 DATA_MAIN_FILE           = 'Data.tsv'
@@ -98,13 +97,13 @@ class UraLexReader:
         '''Read custom version from an extracted raw folder'''
         self._version = "custom"
         try:
-            self._languages   = self._readCsv(open(os.path.join("raw", LANGUAGE_FILE)))
-            self._mlists      = self._readCsv(open(os.path.join("raw", MLISTS_FILE)))
-            self._mnames      = self._readCsv(open(os.path.join("raw", MNAMES_FILE)))
-            self._data        = self._readCsv(open(os.path.join("raw", DATA_MAIN_FILE)))
-
-        except:
-            print("Could not load raw folder contents. Please ensure that you have a 'raw' folder containing all the TSV files.")
+            self._languages   = self._readCsv(open(os.path.join(folder, LANGUAGE_FILE)))
+            self._mlists      = self._readCsv(open(os.path.join(folder, MLISTS_FILE)))
+            self._mnames      = self._readCsv(open(os.path.join(folder, MNAMES_FILE)))
+            self._data        = self._readCsv(open(os.path.join(folder, DATA_MAIN_FILE)))
+        except (OSError, ValueError, csv.Error) as e:
+            print("Could not load raw folder contents: %s" % e, file=sys.stderr)
+            print("Please ensure that you have a '%s' folder containing all the TSV files." % folder, file=sys.stderr)
             sys.exit(1)
 
     def _downloadDataset(self,version):
@@ -117,6 +116,7 @@ class UraLexReader:
         if (prompt == "n"):
             print("Aborting.")
             sys.exit()
+        import urllib.request                                              # imported here to keep up-to-date checks fast
         print("Downloading %s" % version["zipfile"], file=sys.stderr)
         urllib.request.urlretrieve(version["url"],version["zipfile"])
             
@@ -132,21 +132,40 @@ class UraLexReader:
             self._mnames      = self._readCsv(io.TextIOWrapper(z.open(version["dir"] + "/raw/" + MNAMES_FILE)))
             self._data        = self._readCsv(io.TextIOWrapper(z.open(version["dir"] + "/raw/" + DATA_MAIN_FILE)))
             z.close()
-        except:
-            print("%s: Could not load dataset zip file contents." % version["zipfile"], file=sys.stderr)
+        except (OSError, KeyError, ValueError, csv.Error, zipfile.BadZipFile) as e:
+            print("%s: Could not load dataset zip file contents: %s" % (version["zipfile"], e), file=sys.stderr)
             sys.exit(1)
 
     def _addUralexLanguageCode(self):
         '''Add ASCII language codes to raw data to ease processing'''
-        if "uralex_lang" in self._data[0].keys():
+        if self._data != [] and "uralex_lang" in self._data[0].keys():
             return self._data
+        for filename, rows, columns in ((LANGUAGE_FILE, self._languages, ("lgid3", "ASCII_name")), (DATA_MAIN_FILE, self._data, ("lgid3",))):
+            if rows == []:
+                print("%s: no data rows. Use --validate to check the dataset." % filename, file=sys.stderr)
+                sys.exit(1)
+            for column in columns:
+                if column not in rows[0].keys():
+                    print("%s: missing column '%s'. Use --validate to check the dataset." % (filename, column), file=sys.stderr)
+                    sys.exit(1)
+        lang_codes = {}
+        for l_row in self._languages:
+            lang_codes.setdefault(l_row["lgid3"], l_row["ASCII_name"])
         output  = []
-        for d_row in self._data:
-            for l_row in self._languages:
-                if l_row["lgid3"] == d_row["lgid3"]:
-                    d_row["uralex_lang"] = l_row["ASCII_name"]
-                    break
+        unknown = []
+        for row_num, d_row in enumerate(self._data, 2):                    # row 1 is the header
+            lgid3 = d_row.get("lgid3")
+            if lgid3 in lang_codes:
+                d_row["uralex_lang"] = lang_codes[lgid3]
+            else:
+                unknown.append("%s:%i: %s" % (DATA_MAIN_FILE, row_num, lgid3))
             output.append(d_row)
+        if unknown != []:
+            print("Unknown lgid3 codes not listed in %s:" % LANGUAGE_FILE, file=sys.stderr)
+            for i in unknown:
+                print(i, file=sys.stderr)
+            print("Use --validate to check the dataset.", file=sys.stderr)
+            sys.exit(1)
         return output
 
     def _getMeaningsFromList(self,meaning_list):
@@ -15,12 +15,14 @@ import os
 import io
 import errno
 import argparse
-import urllib.request
 import reader
 import versions
 import exporter
+import validator
+import outputcache
 
 #implied constants
+TOOL_VERSION          = "1.1"   # part of the output fingerprint together with a hash of the tool's own modules
 PARSER_DESC           = "Export phylogenetic formats from the raw files of UraLex basic vocabulary dataset."
 DEFAULT_NEXUS_DIALECT = "beast"
 DEFAULT_CHARSETS      = True
@@ -30,8 +32,13 @@ parser = argparse.ArgumentParser(description=PARSER_DESC)
 
 parser.add_argument("-o","--output",
                     dest="outfile",
-                    help="output to file OUTFILE. If not set, will output to STDOUT",
+                    help="output to file OUTFILE. If not set, will output to STDOUT. OUTFILE is overwritten, and skipped if dataset and options are unchanged since it was written",
                     metavar="OUTFILE")
+parser.add_argument("-F","--force",
+                    dest="force",
+                    action='store_true',
+                    default=False,
+                    help="Export even if OUTFILE is up to date.")
 parser.add_argument("-x","--exclude-taxa",
                     dest="exclude_taxa",
                     help="comma-separated list of taxa to exclude",
@@ -80,6 +87,11 @@ parser.add_argument("-d","--dialect",
                     dest="dialect",
                     help="(NEXUS) NEXUS dialect: mrbayes, beast, splitstree. Defaults to \"" + DEFAULT_NEXUS_DIALECT + "\"",
                     default=DEFAULT_NEXUS_DIALECT)
+parser.add_argument("--validate",
+                    dest="validate",
+                    action='store_true',
+                    default=False,
+                    help="Check the dataset for unknown language codes, unlisted meanings, duplicate rows, malformed cognate sets and mixed missing markers, then exit.")
 
 
 
@@ -91,35 +103,50 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
+    if args.validate:
+        if (args.raw_folder == True):
+            dataset = validator.UraLexValidator("raw")
+        else:
+            dataset = validator.UraLexValidator(versions.getLatestVersion())
+        problems = dataset.validate()
+        for line in problems:
+            print(line)
+        if problems != []:
+            print("%i problem(s) found." % len(problems), file=sys.stderr)
+            sys.exit(1)
+        print("No problems found.", file=sys.stderr)
+        sys.exit()
+
     if args.charset_labels and args.dialect != 'beast':
         print("Forcing beast dialect", file=sys.stderr)
         args.dialect="beast"
 
-    excluded_languages = []
-    if args.exclude_taxa != "":
-        excluded_languages = args.exclude_taxa.split(",")
-    dialect = args.dialect
     if (args.raw_folder == True):
-        dataset = reader.UraLexReader("raw", args)
+        version = "raw"
     else:
-        dataset = reader.UraLexReader(versions.getLatestVersion(), args)
+        version = versions.getLatestVersion()
+
+    fingerprint = None
+    if args.outfile != None:
+        fingerprint = outputcache.getFingerprint(version, args, TOOL_VERSION)
+        if not args.force and outputcache.isUpToDate(args.outfile, fingerprint):
+            print("File " + args.outfile + " is up to date.", file=sys.stderr)
+            sys.exit()
+
+    dataset = reader.UraLexReader(version, args)
 
     exporter = exporter.UralexExporter(dataset, args)
     outlines = exporter.export()
 
     if args.outfile != None:
-        if os.path.isfile(args.outfile):
-            while True:
-                prompt = input("File " + args.outfile + " already exists. Overwrite? (y/n)")
-                if (prompt == "y" or prompt == "n"):
-                    break
-            if (prompt == "n"):
-                print("File not written.")
-                sys.exit()
+        outputcache.clearFingerprint(args.outfile)
         f = open(args.outfile,"w")
         for line in outlines:
             f.write(line + "\n")
         f.close()
+        if fingerprint == None:                                   # dataset was downloaded during this run
+            fingerprint = outputcache.getFingerprint(version, args, TOOL_VERSION)
+        outputcache.writeFingerprint(args.outfile, fingerprint)
 
     else:
         for line in outlines:
@@ -129,4 +156,3 @@ if __name__ == '__main__':
             except IOError as e:
                 if e.errno == errno.EPIPE:
                     sys.exit(0)
-
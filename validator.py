@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# Validator class for UraLex files
+
+import re
+import reader
+
+CHARACTER_FIELDS         = ("cogn_set", "form_set")
+VALID_SET_VALUE          = re.compile("^[1-9][0-9]*$")
+
+class UraLexValidator(reader.UraLexReader):
+    '''Check the raw tables of a dataset version without filtering or exporting them'''
+
+    def __init__(self, version):
+        # Only load the tables; the checks must see the data exactly as it is on disk
+        if version == "raw":
+            self._readCustomVersion(version)
+        else:
+            self._readReleaseVersion(version)
+
+    def validate(self):
+        '''Return a list of problems found in the data sheet, each prefixed with file name and row number'''
+        problems = []
+        lang_cols = self._checkColumns(reader.LANGUAGE_FILE, self._languages, ("lgid3", "ASCII_name"), problems)
+        mnames_cols = self._checkColumns(reader.MNAMES_FILE, self._mnames, ("uralex_mng",), problems)
+        mlists_cols = self._checkColumns(reader.MLISTS_FILE, self._mlists, ("uralex_mng",), problems)
+        data_cols = self._checkColumns(reader.DATA_MAIN_FILE, self._data, ("lgid3", "uralex_mng") + CHARACTER_FIELDS, problems)
+        check_langs = "lgid3" in lang_cols and "lgid3" in data_cols                # skip checks whose columns are missing
+        check_mnames = "uralex_mng" in mnames_cols and "uralex_mng" in data_cols
+        check_mlists = "uralex_mng" in mlists_cols and "uralex_mng" in data_cols
+        check_duplicates = set(("lgid3", "uralex_mng", "cogn_set")).issubset(data_cols)
+        fields = [field for field in CHARACTER_FIELDS if field in data_cols]
+        if check_langs:
+            lang_codes = set(row["lgid3"] for row in self._languages)
+        if check_mnames:
+            mnames = set(row["uralex_mng"] for row in self._mnames)
+        if check_mlists:
+            mlists = set(row["uralex_mng"] for row in self._mlists)
+        seen = {}                                                          # (lgid3, uralex_mng, cogn_set) -> first row
+        markers = {}                                                       # field -> {missing marker: [rows]}
+        for field in fields:
+            markers[field] = {}
+        for row_num, row in enumerate(self._data, 2):                      # row 1 is the header
+            where = "%s:%i: " % (reader.DATA_MAIN_FILE, row_num)
+            lang = row.get("lgid3")
+            mng = row.get("uralex_mng")
+            if check_langs and lang not in lang_codes:
+                problems.append(where + "unknown lgid3 %r (not in %s)" % (lang, reader.LANGUAGE_FILE))
+            if check_mnames and mng not in mnames:
+                problems.append(where + "meaning %r missing from %s" % (mng, reader.MNAMES_FILE))
+            if check_mlists and mng not in mlists:
+                problems.append(where + "meaning %r missing from %s" % (mng, reader.MLISTS_FILE))
+            for field in fields:
+                value = row.get(field)
+                if value is None:
+                    problems.append(where + "malformed %s value %r" % (field, value))
+                    continue
+                if value != value.strip():                                 # the exporter strips values, but filters do not
+                    problems.append(where + "stray whitespace around %s value %r" % (field, value))
+                value = value.strip()
+                if value in reader.MISSING_VALUES:
+                    markers[field].setdefault(value, []).append(row_num)
+                elif not VALID_SET_VALUE.match(value):
+                    problems.append(where + "malformed %s value %r" % (field, value))
+            if not check_duplicates:
+                continue
+            cogn_set = row.get("cogn_set")
+            if cogn_set is not None:
+                cogn_set = cogn_set.strip()
+            key = (lang, mng, cogn_set)
+            if key in seen:
+                problems.append(where + "duplicate of row %i (lgid3 %r, meaning %r, cogn_set %r)" % ((seen[key],) + key))
+            else:
+                seen[key] = row_num
+        for field in fields:
+            problems += self._getMixedMarkers(field, markers[field])
+        return problems
+
+    def _checkColumns(self, filename, rows, required, problems):
+        '''Append a problem for each required column missing from rows and return the set of columns present'''
+        if rows == []:
+            problems.append("%s:1: no data rows" % filename)
+            return set()
+        columns = set(rows[0].keys())
+        for column in required:
+            if column not in columns:
+                problems.append("%s:1: missing column %r" % (filename, column))
+        return columns
+
+    def _getMixedMarkers(self, field, markers):
+        '''Return problems for rows deviating from the most common missing marker of field'''
+        if len(markers) < 2:
+            return []
+        usual = max(sorted(markers), key=lambda m: len(markers[m]))
+        problems = []
+        for marker in sorted(markers):
+            if marker == usual:
+                continue
+            for row_num in markers[marker]:
+                problems.append("%s:%i: mixed missing markers in %s: %r (elsewhere %r)" % (reader.DATA_MAIN_FILE, row_num, field, marker, usual))
+        return problems
+
+if __name__ == '__main__':
+    print("Validator class for UraLex dataset")